@@ -6,7 +6,9 @@ and management. Models follow the dataclass pattern with Cosmos DB
 serialization support.
 """
 
+import base64
 import time
+from array import array
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -33,6 +35,58 @@ class RecommendationClass(str, Enum):
     UNCLASSIFIED = "unclassified"  # Not yet classified
 
 
+def quantize_embedding(embedding: list[float]) -> tuple[str, float]:
+    """
+    Quantize an embedding to int8 with a per-vector scale for compact storage.
+
+    Args:
+        embedding: Embedding vector as list of floats.
+
+    Returns:
+        Tuple of (base64-encoded int8 values, scale factor).
+    """
+    scale = max((abs(value) for value in embedding), default=0.0) / 127.0 or 1.0
+    quantized = array("b", (round(value / scale) for value in embedding))
+    return base64.b64encode(quantized.tobytes()).decode("ascii"), scale
+
+
+def dequantize_embedding(data: str, scale: float) -> list[float]:
+    """
+    Restore an embedding stored by quantize_embedding.
+
+    Args:
+        data: Base64-encoded int8 values.
+        scale: Scale factor stored alongside the values.
+
+    Returns:
+        Embedding vector as list of floats.
+    """
+    quantized = array("b")
+    quantized.frombytes(base64.b64decode(data))
+    return [value * scale for value in quantized]
+
+
+def get_cosmos_embedding(item: dict[str, Any]) -> list[float]:
+    """
+    Read the embedding of a Cosmos DB idea document.
+
+    Supports both the plain float array and the int8-quantized
+    ``embedding_q8``/``embedding_scale`` representation.
+
+    Args:
+        item: Dictionary from Cosmos DB query result.
+
+    Returns:
+        Embedding vector as list of floats (empty if none is stored).
+    """
+    embedding = item.get("embedding")
+    if embedding:
+        return embedding
+    if item.get("embedding_q8"):
+        return dequantize_embedding(item["embedding_q8"], item.get("embedding_scale", 1.0))
+    return []
+
+
 @dataclass
 class IdeaKPIEstimates:
     """
@@ -105,6 +159,8 @@ class Idea:
     summary: str = ""
     tags: list[str] = field(default_factory=list)
     embedding: list[float] = field(default_factory=list)
+    # Hash of the embedding input and model, set by the embedding migration
+    embedding_input_sha256: str = ""
 
     # Scoring fields (Phase 2) - Initial deterministic scores
     impact_score: float = 0.0
@@ -136,9 +192,22 @@ class Idea:
         """
         Convert the idea to a Cosmos DB document format.
 
+        The embedding is stored int8-quantized as ``embedding_q8`` plus
+        ``embedding_scale`` instead of the float array returned by to_dict.
+
         Returns:
             Dictionary representation suitable for Cosmos DB storage.
         """
+        item = self.to_dict()
+        embedding = item.pop("embedding")
+        if embedding:
+            item["embedding_q8"], item["embedding_scale"] = quantize_embedding(embedding)
+        if self.embedding_input_sha256:
+            item["embedding_input_sha256"] = self.embedding_input_sha256
+        return item
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON API response."""
         return {
             "id": self.idea_id,
             "ideaId": self.idea_id,
@@ -205,7 +274,8 @@ class Idea:
             updated_at=item.get("updatedAt", 0),
             summary=item.get("summary", ""),
             tags=item.get("tags", []),
-            embedding=item.get("embedding", []),
+            embedding=get_cosmos_embedding(item),
+            embedding_input_sha256=item.get("embedding_input_sha256", ""),
             impact_score=item.get("impactScore", 0.0),
             feasibility_score=item.get("feasibilityScore", 0.0),
             recommendation_class=item.get("recommendationClass", RecommendationClass.UNCLASSIFIED.value),
@@ -222,10 +292,6 @@ class Idea:
             similar_ideas=item.get("similarIdeas", []),
         )
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON API response."""
-        return self.to_cosmos_item()
-
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp to current time."""
         self.updated_at = int(time.time() * 1000)
@@ -294,7 +360,7 @@ class IdeaListResponse:
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON response."""
         return {
-            "ideas": [idea.to_cosmos_item() for idea in self.ideas],
+            "ideas": [idea.to_dict() for idea in self.ideas],
             "totalCount": self.total_count,
             "page": self.page,
             "pageSize": self.page_size,
@@ -662,8 +662,8 @@ class IdeasScheduler:
                 SELECT * FROM c
                 WHERE c.type = 'idea'
                 AND c.status != @archived
-                AND IS_DEFINED(c.embedding)
-                AND ARRAY_LENGTH(c.embedding) > 0
+                AND ((IS_DEFINED(c.embedding) AND ARRAY_LENGTH(c.embedding) > 0)
+                     OR IS_DEFINED(c.embedding_q8))
                 ORDER BY c.createdAt DESC
             """
             parameters = [
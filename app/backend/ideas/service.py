@@ -27,6 +27,7 @@ from .models import (
     IdeaStatus,
     SimilarIdea,
     SimilarIdeasResponse,
+    get_cosmos_embedding,
 )
 from .scoring import IdeaScorer, ScoringConfig
 
@@ -1045,6 +1046,49 @@ class IdeasService:
             logger.error(f"Error generating embedding: {e}")
             return []
 
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """
+        Generate embedding vectors for several texts in a single request.
+
+        Empty texts are skipped and get an empty vector, like in
+        generate_embedding.
+
+        Args:
+            texts: Texts to embed.
+
+        Returns:
+            One embedding vector per input text, in input order. All vectors
+            are empty if the request fails.
+        """
+        embeddings: list[list[float]] = [[] for _ in texts]
+
+        if not self.openai_client:
+            logger.warning("OpenAI client not configured, skipping embedding generation")
+            return embeddings
+
+        # Same truncation as generate_embedding, roughly 4 chars per token
+        max_chars = 30000
+        indexed_texts = [(i, text[:max_chars]) for i, text in enumerate(texts) if text and text.strip()]
+        if not indexed_texts:
+            logger.warning("Empty texts provided for embedding generation")
+            return embeddings
+
+        try:
+            model = self.embedding_deployment or self.embedding_model
+            response = await self.openai_client.embeddings.create(
+                model=model,
+                input=[text for _, text in indexed_texts],
+            )
+
+            for data in response.data:
+                embeddings[indexed_texts[data.index][0]] = data.embedding
+            logger.info(f"Generated {len(response.data)} embeddings in one request")
+            return embeddings
+
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            return embeddings
+
     async def find_similar_ideas(
         self,
         text: str,
@@ -1216,7 +1260,10 @@ class IdeasService:
 
         try:
             # Query all ideas with embeddings
-            query = "SELECT * FROM c WHERE IS_DEFINED(c.embedding) AND ARRAY_LENGTH(c.embedding) > 0"
+            query = (
+                "SELECT * FROM c WHERE (IS_DEFINED(c.embedding) AND ARRAY_LENGTH(c.embedding) > 0) "
+                "OR IS_DEFINED(c.embedding_q8)"
+            )
             items = self.ideas_container.query_items(
                 query=query,
             )
@@ -1229,7 +1276,7 @@ class IdeasService:
                     continue
 
                 # Get embedding
-                item_embedding = item.get("embedding", [])
+                item_embedding = get_cosmos_embedding(item)
                 if not item_embedding:
                     continue
 
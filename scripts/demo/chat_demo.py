@@ -42,6 +42,11 @@ lade_env_datei()
 DEFAULT_SEARCH_ENDPOINT = "https://gptkb-vyuvvvwlwg5jo.search.windows.net"
 DEFAULT_INDEX_NAME = "gptkbindex"
 
+# Filter fuer nur oeffentliche Dokumente da wir den Index von Keiko nutzen:
+# - oids/any(o: o eq 'all'): Dokumente mit 'all' im oids-Feld
+# - (not oids/any(o: o ne null)): Dokumente mit leerem oids-Array
+PUBLIC_FILTER = "(oids/any(o: o eq 'all') or (not oids/any(o: o ne null)))"
+
 
 def lade_umgebungsvariablen() -> dict[str, str]:
     """
@@ -88,16 +93,6 @@ def erstelle_search_client(config: dict[str, str]) -> SearchClient:
     )
 
 
-def erstelle_oeffentlicher_filter() -> str:
-    """
-    Erstellt einen Filter fuer nur oeffentliche Dokumente da wir den Index von Keiko nutzen.
-    """
-    # Filter fuer oeffentliche Dokumente:
-    # - oids/any(o: o eq 'all'): Dokumente mit 'all' im oids-Feld
-    # - (not oids/any(o: o ne null)): Dokumente mit leerem oids-Array
-    return "(oids/any(o: o eq 'all') or (not oids/any(o: o ne null)))"
-
-
 def suche_im_index(
         client: SearchClient,
         suchanfrage: str,
@@ -107,11 +102,9 @@ def suche_im_index(
     Fuehrt eine Suche im Azure AI Search Index durch.
     """
     # Filter fuer oeffentliche Dokumente anwenden
-    oeffentlicher_filter = erstelle_oeffentlicher_filter()
-
     ergebnisse = client.search(
         search_text=suchanfrage,
-        filter=oeffentlicher_filter,
+        filter=PUBLIC_FILTER,
         top=top,
         include_total_count=True,
     )
@@ -8,6 +8,8 @@ response times, success rates, and throughput.
 Usage:
     python scripts/loadtest.py <url> [options]
 
+Uses uvloop as event loop when it is installed (pip install "uvloop>=0.18").
+
 Examples:
     python scripts/loadtest.py http://localhost:5000/health
     python scripts/loadtest.py http://localhost:5000/api/endpoint -n 1000 -c 50
@@ -33,11 +35,13 @@ class LoadTestResult:
     total_requests: int = 0
     successful_requests: int = 0
     failed_requests: int = 0
-    response_times: list[float] = field(default_factory=list)
+    response_times: list[int] = field(default_factory=list)  # nanoseconds
     status_codes: dict[int, int] = field(default_factory=dict)
     errors: list[str] = field(default_factory=list)
     start_time: float = 0.0
     end_time: float = 0.0
+    # Cached statistics, internal state only (not an __init__ parameter)
+    _stats: Optional[dict[str, float]] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def duration(self) -> float:
@@ -54,43 +58,59 @@ class LoadTestResult:
         """Percentage of successful requests."""
         return (self.successful_requests / self.total_requests * 100) if self.total_requests > 0 else 0
 
+    def finalize(self) -> dict[str, float]:
+        """Compute response time statistics once from a single sort of the samples."""
+        if not self.response_times:
+            self._stats = dict.fromkeys(("min", "avg", "max", "p50", "p95", "p99"), 0.0)
+            return self._stats
+        sorted_times = sorted(self.response_times)
+        count = len(sorted_times)
+        mid = count // 2
+        median = sorted_times[mid] if count % 2 else (sorted_times[mid - 1] + sorted_times[mid]) / 2
+        self._stats = {
+            "min": sorted_times[0] / 1e6,
+            "avg": statistics.fmean(sorted_times) / 1e6,
+            "max": sorted_times[-1] / 1e6,
+            "p50": median / 1e6,
+            "p95": sorted_times[int(count * 0.95)] / 1e6,
+            "p99": sorted_times[int(count * 0.99)] / 1e6,
+        }
+        return self._stats
+
+    def _stat(self, name: str) -> float:
+        """Return a response time statistic, computing all of them on first access."""
+        stats = self._stats or self.finalize()
+        return stats[name]
+
     @property
     def avg_response_time(self) -> float:
         """Average response time in milliseconds."""
-        return statistics.mean(self.response_times) * 1000 if self.response_times else 0
+        return self._stat("avg")
 
     @property
     def min_response_time(self) -> float:
         """Minimum response time in milliseconds."""
-        return min(self.response_times) * 1000 if self.response_times else 0
+        return self._stat("min")
 
     @property
     def max_response_time(self) -> float:
         """Maximum response time in milliseconds."""
-        return max(self.response_times) * 1000 if self.response_times else 0
+        return self._stat("max")
 
     @property
     def p50_response_time(self) -> float:
         """50th percentile (median) response time in milliseconds."""
-        return statistics.median(self.response_times) * 1000 if self.response_times else 0
+        return self._stat("p50")
 
     @property
     def p95_response_time(self) -> float:
         """95th percentile response time in milliseconds."""
-        if not self.response_times:
-            return 0
-        sorted_times = sorted(self.response_times)
-        index = int(len(sorted_times) * 0.95)
-        return sorted_times[index] * 1000
+        return self._stat("p95")
 
     @property
     def p99_response_time(self) -> float:
         """99th percentile response time in milliseconds."""
-        if not self.response_times:
-            return 0
-        sorted_times = sorted(self.response_times)
-        index = int(len(sorted_times) * 0.99)
-        return sorted_times[index] * 1000
+        return self._stat("p99")
 
 
 async def make_request(
@@ -104,11 +124,11 @@ async def make_request(
 ) -> None:
     """Make a single HTTP request and record the result."""
     async with semaphore:
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         try:
             async with session.request(method, url, headers=headers, data=data) as response:
                 await response.read()
-                elapsed = time.perf_counter() - start_time
+                elapsed = time.perf_counter_ns() - start_time
                 result.response_times.append(elapsed)
                 result.status_codes[response.status] = result.status_codes.get(response.status, 0) + 1
                 if 200 <= response.status < 400:
@@ -116,7 +136,7 @@ async def make_request(
                 else:
                     result.failed_requests += 1
         except Exception as e:
-            elapsed = time.perf_counter() - start_time
+            elapsed = time.perf_counter_ns() - start_time
             result.response_times.append(elapsed)
             result.failed_requests += 1
             result.errors.append(str(e))
@@ -142,12 +162,17 @@ async def run_load_test(
 
     async with aiohttp.ClientSession(connector=connector, timeout=timeout_config) as session:
         result.start_time = time.perf_counter()
-        tasks = [
-            make_request(session, url, method, headers, data, result, semaphore) for _ in range(num_requests)
-        ]
-        await asyncio.gather(*tasks)
+        # Create tasks lazily so memory stays O(concurrency) instead of O(num_requests)
+        pending: set[asyncio.Task] = set()
+        for _ in range(num_requests):
+            if len(pending) >= concurrency * 2:
+                _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            pending.add(asyncio.create_task(make_request(session, url, method, headers, data, result, semaphore)))
+        await asyncio.gather(*pending)
         result.end_time = time.perf_counter()
 
+    result.finalize()
+
     return result
 
 
@@ -189,12 +214,11 @@ def parse_headers(header_strings: Optional[list[str]]) -> Optional[dict]:
     """Parse header strings in 'Key: Value' format into a dictionary."""
     if not header_strings:
         return None
-    headers = {}
-    for header in header_strings:
-        if ":" in header:
-            key, value = header.split(":", 1)
-            headers[key.strip()] = value.strip()
-    return headers
+    return {
+        key.strip(): value.strip()
+        for key, sep, value in (header.partition(":") for header in header_strings)
+        if sep
+    }
 
 
 def main() -> int:
@@ -246,7 +270,21 @@ Examples:
     print(f"Requests: {args.num_requests}, Concurrency: {args.concurrency}")
     print(f"Method: {args.method.upper()}")
 
-    result = asyncio.run(
+    # Prefer uvloop's faster event loop when it is installed. uvloop.run only
+    # exists since uvloop 0.18, older versions install their event loop policy
+    # so that asyncio.run picks it up.
+    try:
+        import uvloop
+    except ImportError:
+        run = asyncio.run
+    else:
+        if hasattr(uvloop, "run"):
+            run = uvloop.run
+        else:
+            uvloop.install()
+            run = asyncio.run
+
+    result = run(
         run_load_test(
             url=args.url,
             num_requests=args.num_requests,
@@ -278,7 +316,14 @@ Examples:
             "status_codes": result.status_codes,
             "errors": list(set(result.errors)),
         }
-        print(json.dumps(output, indent=2))
+        try:
+            import orjson
+        except ImportError:
+            print(json.dumps(output, indent=2))
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            sys.stdout.buffer.write(b"\n")
     else:
         print_results(result, args.url)
 
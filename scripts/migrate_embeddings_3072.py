@@ -11,21 +11,21 @@ This script:
 
 Usage:
     python scripts/migrate_embeddings_3072.py
+    python scripts/migrate_embeddings_3072.py --reuse-embeddings  # keep unchanged embeddings (lossy index)
 """
 
+import argparse
 import asyncio
+import hashlib
 import importlib.util
 import os
 import sys
-
-# Add the app directory to the path
-app_dir = os.path.join(os.path.dirname(__file__), "..", "app")
-sys.path.insert(0, app_dir)
-os.chdir(app_dir)
+from pathlib import Path
+from typing import Any
 
 from azure.cosmos.aio import CosmosClient
 from azure.identity.aio import DefaultAzureCredential, get_bearer_token_provider
-from openai import AsyncAzureOpenAI
+from openai import AsyncAzureOpenAI, RateLimitError
 
 
 def load_module_directly(module_path: str, module_name: str):
@@ -37,20 +37,262 @@ def load_module_directly(module_path: str, module_name: str):
     return module
 
 
-# Load search_index module directly to avoid circular imports
-search_index_path = os.path.join(app_dir, "backend", "ideas", "search_index.py")
-search_index = load_module_directly(search_index_path, "search_index")
-IdeasSearchIndexManager = search_index.IdeasSearchIndexManager
-EMBEDDING_DIMENSIONS = search_index.EMBEDDING_DIMENSIONS
+# Pipeline tuning for step 4: embedding workers, Cosmos/Search writers and
+# the number of ideas sent to the embeddings API per request
+EMBED_WORKERS = 4
+WRITE_WORKERS = 16
+EMBED_BATCH_SIZE = 16
+# Attempts per embedding batch when Azure OpenAI answers with 429
+RATE_LIMIT_ATTEMPTS = 5
+# Embedding inputs are cut like in IdeasService.generate_embedding
+# (text-embedding-3-large has an 8191 token limit, roughly 4 chars per token)
+MAX_EMBEDDING_CHARS = 30000
+
+
+class Admission:
+    """
+    Adaptive concurrency limit for embedding requests.
+
+    Halves the number of allowed in-flight requests on every rate-limit (429)
+    response and raises it by one after a run of successful requests, so
+    throughput settles just below the deployment's quota.
+    """
+
+    def __init__(self, limit: int, increase_after: int = 10):
+        self.limit = limit
+        self.max_in_flight = limit
+        self.in_flight = 0
+        self.increase_after = increase_after
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a request slot is free and take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.max_in_flight)
+            self.in_flight += 1
+
+    async def release(self, outcome: str) -> None:
+        """
+        Free a request slot and adapt the limit to the outcome.
+
+        Args:
+            outcome: ``"success"`` counts towards raising the limit, ``"throttled"``
+                halves it and ``"neutral"`` (any other error) leaves it unchanged.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if outcome == "success":
+                self._successes += 1
+                if self._successes >= self.increase_after and self.max_in_flight < self.limit:
+                    self.max_in_flight += 1
+                    self._successes = 0
+            elif outcome == "throttled":
+                self._successes = 0
+                self.max_in_flight = max(1, self.max_in_flight // 2)
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> "Admission":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        # Only rate limiting signals overload; other errors leave the limit alone
+        if exc is None:
+            await self.release("success")
+        elif isinstance(exc, RateLimitError):
+            await self.release("throttled")
+        else:
+            await self.release("neutral")
+
+
+def embedding_digest(text: str, model: str) -> str:
+    """Hash an embedding input together with the model/deployment that embeds it."""
+    return hashlib.sha256(f"{model}\n{text}".encode()).hexdigest()
+
+
+def build_embedding_text(idea: dict) -> str:
+    """Build the text that is embedded for an idea."""
+    text = f"{idea.get('title', '')} {idea.get('description', '')}"
+    if idea.get("expectedBenefits"):
+        text += f" {idea.get('expectedBenefits')}"
+    return text
+
+
+async def regenerate_embeddings(
+    ideas: list[dict],
+    openai_client: AsyncAzureOpenAI,
+    model: str,
+    container,
+    search_index_manager,
+    reuse_embeddings: bool = False,
+) -> tuple[int, int]:
+    """
+    Regenerate embeddings for all ideas and write them back.
+
+    Runs as a three-stage pipeline so that building the text, calling the
+    embeddings API and writing to Cosmos DB + Azure Search overlap:
+
+    1. ``build_producer`` fills ``text_q`` with ``(idea, text, digest)`` tuples
+    2. ``embed_worker`` tasks embed batches and push ``(idea, embedding, digest)`` to ``write_q``
+    3. ``write_worker`` tasks upsert into Cosmos DB and the search index
+
+    Both queues are bounded for backpressure; ``None`` sentinels end each stage.
+    A batch that fails with anything but a 429 is retried one idea at a time,
+    so a single rejected input only fails its own idea.
+
+    By default every idea is re-embedded, because the search index was just
+    rebuilt and needs full-precision vectors. With ``reuse_embeddings``, ideas
+    whose stored ``embedding_input_sha256`` matches the current text and
+    embedding model, and whose embedding already has the target dimensions,
+    skip the embeddings API and Cosmos DB write. They are only pushed to the
+    rebuilt search index again, with the vector dequantized from Cosmos DB's
+    int8 copy, so the index receives a lossy vector for these ideas.
+
+    Cosmos DB stores the embedding int8-quantized (``embedding_q8`` plus
+    ``embedding_scale``) instead of the FP32 array; the search index still
+    receives the full-precision vector.
+
+    Returns:
+        Tuple of (success_count, error_count).
+    """
+    text_q: asyncio.Queue = asyncio.Queue(maxsize=EMBED_BATCH_SIZE * 2)
+    write_q: asyncio.Queue = asyncio.Queue(maxsize=EMBED_BATCH_SIZE * 2)
+    total = len(ideas)
+    counts = {"success": 0, "error": 0}
+    admission = Admission(limit=EMBED_WORKERS)
+
+    def report(idea: dict, message: str, success: bool) -> None:
+        counts["success" if success else "error"] += 1
+        done = counts["success"] + counts["error"]
+        title = idea.get("title", "Untitled")[:50]
+        print(f"  [{done}/{total}] {title}... {message}")
+
+    async def build_producer() -> None:
+        for idea in ideas:
+            text = build_embedding_text(idea)
+            digest = embedding_digest(text, model)
+            if reuse_embeddings and idea.get("embedding_input_sha256") == digest:
+                embedding = get_cosmos_embedding(idea)
+                if len(embedding) == EMBEDDING_DIMENSIONS:
+                    await write_q.put((idea, embedding, None))
+                    continue
+            await text_q.put((idea, text, digest))
+        for _ in range(EMBED_WORKERS):
+            await text_q.put(None)
+
+    async def embed_batch(texts: list[str]) -> list[list[float]]:
+        attempt = 0
+        while True:
+            try:
+                async with admission:
+                    response = await openai_client.embeddings.create(
+                        model=model, input=[text[:MAX_EMBEDDING_CHARS] for text in texts]
+                    )
+                return [data.embedding for data in sorted(response.data, key=lambda d: d.index)]
+            except RateLimitError:
+                attempt += 1
+                if attempt == RATE_LIMIT_ATTEMPTS:
+                    raise
+                await asyncio.sleep(2 ** (attempt - 1))
+
+    async def embed_one(idea: dict, text: str, digest: str) -> None:
+        try:
+            [embedding] = await embed_batch([text])
+        except Exception as e:
+            report(idea, f"ERROR: {e}", success=False)
+            return
+        await write_q.put((idea, embedding, digest))
+
+    async def embed_worker() -> None:
+        finished = False
+        while not finished:
+            # Take what is queued up to the batch size instead of waiting for a full batch
+            batch: list[tuple[dict[str, Any], str, str]] = []
+            while len(batch) < EMBED_BATCH_SIZE:
+                item = await text_q.get()
+                if item is None:
+                    finished = True
+                    break
+                batch.append(item)
+                if text_q.empty():
+                    break
+            if not batch:
+                continue
+
+            try:
+                embeddings = await embed_batch([text for _, text, _ in batch])
+            except Exception as e:
+                if len(batch) == 1 or isinstance(e, RateLimitError):
+                    for idea, _, _ in batch:
+                        report(idea, f"ERROR: {e}", success=False)
+                else:
+                    # One oversized or rejected input fails the whole request,
+                    # so embed the ideas one by one to isolate it
+                    for idea, text, digest in batch:
+                        await embed_one(idea, text, digest)
+                continue
+
+            for (idea, _, digest), embedding in zip(batch, embeddings, strict=True):
+                await write_q.put((idea, embedding, digest))
+
+    async def write_worker() -> None:
+        while (item := await write_q.get()) is not None:
+            idea, embedding, digest = item
+            try:
+                if digest is None:
+                    # Embedding is up to date, only the new index needs the document.
+                    # Its vector is dequantized from int8, so it is lossy.
+                    await search_index_manager.update_document({**idea, "embedding": embedding})
+                    report(idea, f"SKIPPED ({len(embedding)} dims, unchanged)", success=True)
+                    continue
+
+                # Update Cosmos DB (quantized) and search index (FP32) concurrently
+                idea.pop("embedding", None)
+                idea["embedding_q8"], idea["embedding_scale"] = quantize_embedding(embedding)
+                idea["embedding_input_sha256"] = digest
+                await asyncio.gather(
+                    container.upsert_item(idea),
+                    search_index_manager.update_document({**idea, "embedding": embedding}),
+                )
+                report(idea, f"OK ({len(embedding)} dims)", success=True)
+            except Exception as e:
+                report(idea, f"ERROR: {e}", success=False)
+
+    writers = [asyncio.create_task(write_worker()) for _ in range(WRITE_WORKERS)]
+    await asyncio.gather(build_producer(), *(embed_worker() for _ in range(EMBED_WORKERS)))
+    for _ in range(WRITE_WORKERS):
+        await write_q.put(None)
+    await asyncio.gather(*writers)
+
+    return counts["success"], counts["error"]
+
+
+async def load_ideas(cosmos_client: CosmosClient, database_name: str, container_name: str) -> tuple[list[dict], Any]:
+    """
+    Open the ideas container and load all ideas from Cosmos DB.
+
+    Returns:
+        Tuple of (ideas, container client).
+    """
+    database = cosmos_client.get_database_client(database_name)
+    container = database.get_container_client(container_name)
+
+    ideas = []
+    query_items = container.query_items(query="SELECT * FROM c WHERE c.type = 'idea'")
+    async for item in query_items:
+        ideas.append(item)
+    return ideas, container
 
-# Load azd environment loader directly
-load_azd_path = os.path.join(app_dir, "backend", "load_azd_env.py")
-load_azd_module = load_module_directly(load_azd_path, "load_azd_env")
-load_azd_env = load_azd_module.load_azd_env
 
+async def main(reuse_embeddings: bool = False):
+    """
+    Main migration function.
 
-async def main():
-    """Main migration function."""
+    Args:
+        reuse_embeddings: Index unchanged ideas with their stored int8 embedding
+            instead of re-embedding them (see regenerate_embeddings).
+    """
     # Load environment variables from azd
     load_azd_env()
 
@@ -96,82 +338,91 @@ async def main():
         embedding_dimensions=EMBEDDING_DIMENSIONS,
     )
 
-    # Step 1: Delete existing index
-    print("\n[1/4] Deleting existing search index...")
-    if await search_index_manager.index_exists():
-        await search_index_manager.delete_index()
-        print("  Index deleted successfully")
-    else:
-        print("  Index does not exist, skipping deletion")
-
-    # Step 2: Create new index with 3072 dimensions
-    print("\n[2/4] Creating new search index with 3072 dimensions...")
-    success = await search_index_manager.create_or_update_index()
-    if success:
-        print("  Index created successfully")
-    else:
-        print("  ERROR: Failed to create index")
-        return
-
-    # Step 3: Get all ideas from Cosmos DB
-    print("\n[3/4] Loading ideas from Cosmos DB...")
+    # Cosmos DB bring-up and the idea query run in the background while
+    # the search index is rebuilt (steps 1 and 2)
     cosmos_client = CosmosClient(
         url=cosmos_endpoint,
         credential=credential,
     )
-    database = cosmos_client.get_database_client(database_name)
-    container = database.get_container_client(container_name)
-
-    ideas = []
-    query_items = container.query_items(query="SELECT * FROM c WHERE c.type = 'idea'")
-    async for item in query_items:
-        ideas.append(item)
-    print(f"  Found {len(ideas)} ideas")
-
-    # Step 4: Regenerate embeddings and update
-    print("\n[4/4] Regenerating embeddings and indexing...")
-    model = embedding_deployment or "text-embedding-3-large"
-    success_count = 0
-    error_count = 0
-
-    for i, idea in enumerate(ideas, 1):
-        idea_id = idea.get("id", "unknown")
-        title = idea.get("title", "Untitled")[:50]
-        print(f"  [{i}/{len(ideas)}] {title}...", end=" ")
-
-        try:
-            # Generate text for embedding
-            text = f"{idea.get('title', '')} {idea.get('description', '')}"
-            if idea.get("expectedBenefits"):
-                text += f" {idea.get('expectedBenefits')}"
-
-            # Generate new embedding
-            response = await openai_client.embeddings.create(model=model, input=text)
-            embedding = response.data[0].embedding
-
-            # Update Cosmos DB
-            idea["embedding"] = embedding
-            await container.upsert_item(idea)
-
-            # Update search index
-            await search_index_manager.update_document(idea)
-
-            print(f"OK ({len(embedding)} dims)")
-            success_count += 1
-        except Exception as e:
-            print(f"ERROR: {e}")
-            error_count += 1
-
-    # Cleanup
-    await search_index_manager.close()
-    await cosmos_client.close()
-    await credential.close()
-    await openai_client.close()
+    cosmos_setup = asyncio.create_task(load_ideas(cosmos_client, database_name, container_name))
+
+    try:
+        # Step 1: Delete existing index
+        print("\n[1/4] Deleting existing search index...")
+        if await search_index_manager.index_exists():
+            await search_index_manager.delete_index()
+            print("  Index deleted successfully")
+        else:
+            print("  Index does not exist, skipping deletion")
+
+        # Step 2: Create new index with 3072 dimensions
+        print("\n[2/4] Creating new search index with 3072 dimensions...")
+        success = await search_index_manager.create_or_update_index()
+        if success:
+            print("  Index created successfully")
+        else:
+            print("  ERROR: Failed to create index")
+            return
+
+        # Step 3: Get all ideas from Cosmos DB
+        print("\n[3/4] Loading ideas from Cosmos DB...")
+        ideas, container = await cosmos_setup
+        print(f"  Found {len(ideas)} ideas")
+
+        # Step 4: Regenerate embeddings and update
+        print("\n[4/4] Regenerating embeddings and indexing...")
+        model = embedding_deployment or "text-embedding-3-large"
+        success_count, error_count = await regenerate_embeddings(
+            ideas, openai_client, model, container, search_index_manager, reuse_embeddings
+        )
+    finally:
+        # The idea query is still pending if an index step failed or raised;
+        # cancel it and wait for it before the Cosmos DB client is closed
+        cosmos_setup.cancel()
+        await asyncio.gather(cosmos_setup, return_exceptions=True)
+
+        # Cleanup
+        await search_index_manager.close()
+        await cosmos_client.close()
+        await credential.close()
+        await openai_client.close()
 
     print("\n" + "=" * 60)
     print(f"Migration complete: {success_count} success, {error_count} errors")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Add the app directory to the path and load the backend modules only when
+    # run as a script, so importing this module (e.g. from the tests) leaves
+    # sys.path and the working directory alone. The names bound here are the
+    # module globals used by the functions above.
+    app_dir = os.path.join(os.path.dirname(__file__), "..", "app")
+    sys.path.insert(0, app_dir)
+    os.chdir(app_dir)
+
+    # Load search_index module directly to avoid circular imports
+    search_index_path = os.path.join(app_dir, "backend", "ideas", "search_index.py")
+    search_index = load_module_directly(search_index_path, "search_index")
+    IdeasSearchIndexManager = search_index.IdeasSearchIndexManager
+    EMBEDDING_DIMENSIONS = search_index.EMBEDDING_DIMENSIONS
+
+    # Load models module directly for the embedding (de)quantization helpers
+    models_path = str(Path(app_dir) / "backend" / "ideas" / "models.py")
+    idea_models = load_module_directly(models_path, "idea_models")
+    quantize_embedding = idea_models.quantize_embedding
+    get_cosmos_embedding = idea_models.get_cosmos_embedding
+
+    # Load azd environment loader directly
+    load_azd_path = os.path.join(app_dir, "backend", "load_azd_env.py")
+    load_azd_module = load_module_directly(load_azd_path, "load_azd_env")
+    load_azd_env = load_azd_module.load_azd_env
+
+    parser = argparse.ArgumentParser(description="Migrate the ideas to 3072-dimensional embeddings.")
+    parser.add_argument(
+        "--reuse-embeddings",
+        action="store_true",
+        help="Skip re-embedding unchanged ideas and index their stored int8 embedding (lossy)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(reuse_embeddings=args.reuse_embeddings))
 
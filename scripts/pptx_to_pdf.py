@@ -2,63 +2,186 @@
 """
 Convert PowerPoint presentation to PDF including speaker notes.
 
-This script converts a PPTX file to a PDF document where each page contains
-the slide image (rendered via LibreOffice) followed by the speaker notes below it.
+This script converts PPTX files to PDF documents where each page contains
+the slide followed by its speaker notes below it.
+
+Pipeline:
+    1. LibreOffice converts each presentation to a PDF with one page per slide.
+    2. PyMuPDF places every slide page as vector graphics onto an A4 page and
+       writes the speaker notes below it.
+    3. Slides whose notes do not fit on their page are instead rendered to a
+       raster image and laid out with reportlab, letting the notes continue on
+       the next page. These pages are built in worker processes and spliced
+       into the output in place of the slide's single page.
 
 Requirements:
     - python-pptx: For extracting speaker notes from PPTX files
-    - reportlab: For PDF creation
-    - Pillow: For image processing
-    - PyMuPDF: For PDF to image conversion
-    - LibreOffice: For rendering slides to images (must be installed separately)
+    - reportlab: For the layout of slides with overflowing notes
+    - Pillow: Used by reportlab to embed the slide images
+    - PyMuPDF: For composing the output PDF and rendering overflowing slides
+    - LibreOffice: For converting PPTX to PDF (must be installed separately,
+      set LIBREOFFICE_PATH if it is not in a standard location or on PATH)
+
+When LibreOffice's Python UNO bindings (``uno``) are importable, a single
+headless LibreOffice listener is started on first use and reused for all
+conversions in the process. Otherwise the presentations are converted by
+soffice via CLI, split across up to one process per CPU.
+
+Usage:
+    python scripts/pptx_to_pdf.py                  # data/Inside Agentic AI.pptx
+    python scripts/pptx_to_pdf.py a.pptx b.pptx    # PDFs next to the inputs
 
 Installation:
     pip install python-pptx reportlab Pillow PyMuPDF
     brew install --cask libreoffice  # macOS
 """
 
+import atexit
+import functools
+import io
+import os
 import shutil
+import socket
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import fitz  # PyMuPDF
-from PIL import Image
+import reportlab
 from pptx import Presentation
 from reportlab.lib.colors import HexColor
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import cm
+from reportlab.lib.utils import ImageReader
 from reportlab.platypus import (
-    Image as RLImage,
-    PageBreak,
+    Flowable,
     Paragraph,
     SimpleDocTemplate,
     Spacer,
 )
 
 
-def find_libreoffice() -> Optional[Path]:
+# Resolution of the slide images at their final size in the output PDF
+SLIDE_IMAGE_DPI = 150
+
+# Slides with more distinct colors than this are treated as photographic
+# and stored as JPEG; flat or text-heavy slides stay lossless
+PHOTO_COLOR_THRESHOLD = 8192
+JPEG_QUALITY = 85
+
+# TrueType fonts for the text of the vector layout, shipped with reportlab.
+# PyMuPDF's built-in Base-14 fonts only cover Latin-1 and would print
+# typographic quotes, dashes, bullets or the euro sign as "?".
+_FONT_DIR = Path(reportlab.__file__).parent / "fonts"
+VECTOR_FONTS = {
+    "vera": _FONT_DIR / "Vera.ttf",
+    "verabd": _FONT_DIR / "VeraBd.ttf",
+    "verait": _FONT_DIR / "VeraIt.ttf",
+}
+
+
+def slide_zoom(page_width: float) -> float:
     """
-    Find the LibreOffice executable on the system.
+    Compute the render zoom so a slide matches SLIDE_IMAGE_DPI in the output PDF.
+
+    Args:
+        page_width: Width of the slide page in points.
 
     Returns:
-        Path to the LibreOffice executable or None if not found.
+        Zoom factor, clamped to the range 1.0 to 2.0.
+    """
+    target_px = (A4[0] - 2 * cm) / 72 * SLIDE_IMAGE_DPI
+    return min(max(target_px / page_width, 1.0), 2.0)
+
+
+def render_page(pdf_path: str, page_num: int, zoom: float) -> tuple[int, bytes, int, int]:
+    """
+    Render a single PDF page to an image.
+
+    Runs in a worker process, so it opens its own copy of the document.
+    Photographic slides are encoded as JPEG, which reportlab embeds as is.
+    All others are returned as uncompressed PPM: reportlab decodes and
+    compresses them itself, so PNG encoding would be wasted work.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        page_num: Zero-based page number.
+        zoom: Render zoom factor.
+
+    Returns:
+        Tuple of (page_num, image bytes, width, height).
     """
-    # Common LibreOffice paths on different systems
-    possible_paths = [
-        # macOS
+    with fitz.open(pdf_path) as pdf_doc:
+        pix = pdf_doc[page_num].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+        if pix.color_count() > PHOTO_COLOR_THRESHOLD:
+            image_bytes = pix.tobytes("jpeg", jpg_quality=JPEG_QUALITY)
+        else:
+            image_bytes = pix.tobytes("ppm")
+        return page_num, image_bytes, pix.width, pix.height
+
+
+# soffice startup flags: no UI, splash screen, first start wizard, lock file
+# check or document recovery
+SOFFICE_FLAGS = (
+    "--headless",
+    "--invisible",
+    "--nologo",
+    "--nofirststartwizard",
+    "--nolockcheck",
+    "--norestore",
+)
+
+# Number of soffice output lines kept for error messages
+SOFFICE_OUTPUT_LINES = 200
+
+# Common LibreOffice paths on different systems, keyed by sys.platform
+LIBREOFFICE_PATHS = {
+    "darwin": [
         Path("/Applications/LibreOffice.app/Contents/MacOS/soffice"),
-        # Linux
+    ],
+    "linux": [
         Path("/usr/bin/soffice"),
         Path("/usr/bin/libreoffice"),
         Path("/usr/local/bin/soffice"),
-        # Windows
+    ],
+    "win32": [
         Path("C:/Program Files/LibreOffice/program/soffice.exe"),
         Path("C:/Program Files (x86)/LibreOffice/program/soffice.exe"),
-    ]
+    ],
+}
+
+
+@functools.lru_cache(maxsize=1)
+def find_libreoffice() -> Optional[Path]:
+    """
+    Find the LibreOffice executable on the system.
+
+    The LIBREOFFICE_PATH environment variable takes precedence if it names
+    an executable. Otherwise only the common install locations of the
+    current platform are checked before searching PATH. The result is
+    cached for the process.
+
+    Returns:
+        Path to the LibreOffice executable or None if not found.
+    """
+    env_path = os.environ.get("LIBREOFFICE_PATH")
+    if env_path:
+        # which() also accepts full paths and checks they are executable
+        resolved = shutil.which(env_path)
+        if resolved:
+            return Path(resolved)
+        print(f"Warning: LIBREOFFICE_PATH={env_path} is not an executable, searching default locations")
+
+    possible_paths = LIBREOFFICE_PATHS.get(sys.platform, LIBREOFFICE_PATHS["linux"])
 
     for path in possible_paths:
         if path.exists():
@@ -76,67 +199,176 @@ def find_libreoffice() -> Optional[Path]:
     return None
 
 
-def export_slides_as_images(
-        pptx_path: Path,
-        output_dir: Path,
-        libreoffice_path: Path,
-) -> list[Path]:
+class _SofficeServer:
     """
-    Export PowerPoint slides as PNG images using LibreOffice.
+    Persistent headless LibreOffice instance driven over the UNO bridge.
 
-    Args:
-        pptx_path: Path to the PPTX file.
-        output_dir: Directory where images will be saved.
-        libreoffice_path: Path to the LibreOffice executable.
-
-    Returns:
-        List of paths to the generated PNG images, sorted by slide number.
-    """
-    # First convert PPTX to PDF using LibreOffice
-    cmd = [
-        str(libreoffice_path),
-        "--headless",
-        "--convert-to", "pdf",
-        "--outdir", str(output_dir),
-        str(pptx_path),
-    ]
-
-    result = subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        timeout=300,  # 5 minutes timeout
-    )
+    Avoids the multi-second LibreOffice cold start on every conversion. The
+    instance uses its own user profile so it never hands jobs over to (or
+    exits early because of) another running LibreOffice, and listens on a
+    free port so concurrent script runs never share an instance.
+    """
 
-    if result.returncode != 0:
-        raise RuntimeError(
-            f"LibreOffice conversion failed: {result.stderr}"
+    HOST = "127.0.0.1"
+    CONNECT_TIMEOUT = 30
+    CONVERT_TIMEOUT = 600  # 10 minutes per file, like the soffice CLI
+
+    def __init__(self, libreoffice_path: Path):
+        import uno  # Only available with LibreOffice's Python bindings
+
+        self._uno = uno
+        self._profile_dir = tempfile.TemporaryDirectory(prefix="lo_profile_")
+        with socket.socket() as sock:
+            sock.bind((self.HOST, 0))
+            port = sock.getsockname()[1]
+        connection = f"socket,host={self.HOST},port={port};urp;StarOffice.ComponentContext"
+        self.process = subprocess.Popen(
+            [
+                str(libreoffice_path),
+                *SOFFICE_FLAGS,
+                f"-env:UserInstallation={Path(self._profile_dir.name).as_uri()}",
+                f"--accept={connection}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
+        atexit.register(self.stop)
 
-    # Find the generated PDF
-    pdf_path = output_dir / f"{pptx_path.stem}.pdf"
-    if not pdf_path.exists():
-        raise FileNotFoundError(
-            f"Expected PDF not found: {pdf_path}"
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        deadline = time.monotonic() + self.CONNECT_TIMEOUT
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except Exception as e:
+                if self.process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("Could not connect to LibreOffice listener") from e
+                time.sleep(0.25)
+
+        self._desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context
         )
 
-    # Convert PDF pages to images using sips (macOS) or other tools
-    # For cross-platform compatibility, we'll use a different approach
-    # We'll keep the PDF and extract pages using reportlab
-    return [pdf_path]
+    def is_running(self) -> bool:
+        """Check whether the LibreOffice process is still alive."""
+        return self.process.poll() is None
+
+    def _properties(self, **values) -> tuple:
+        properties = []
+        for name, value in values.items():
+            prop = self._uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+            prop.Name = name
+            prop.Value = value
+            properties.append(prop)
+        return tuple(properties)
+
+    def convert_to_pdf(self, pptx_path: Path, pdf_path: Path) -> None:
+        """
+        Convert a presentation to PDF in the running LibreOffice instance.
+
+        UNO calls block without a timeout, so a watchdog kills the LibreOffice
+        instance if the conversion takes longer than CONVERT_TIMEOUT. The
+        pending call then fails and the next conversion starts a new instance.
+
+        Args:
+            pptx_path: Path to the PPTX file.
+            pdf_path: Path where the PDF will be written.
+
+        Raises:
+            RuntimeError: If LibreOffice cannot open the presentation.
+            TimeoutError: If the conversion does not finish in time.
+        """
+        timed_out = threading.Event()
+
+        def kill() -> None:
+            timed_out.set()
+            self.process.kill()
+
+        watchdog = threading.Timer(self.CONVERT_TIMEOUT, kill)
+        watchdog.daemon = True
+        watchdog.start()
+        document = None
+        try:
+            document = self._desktop.loadComponentFromURL(
+                pptx_path.as_uri(), "_blank", 0, self._properties(Hidden=True)
+            )
+            if document is None:
+                raise RuntimeError(f"LibreOffice could not open {pptx_path.name}")
+            document.storeToURL(pdf_path.as_uri(), self._properties(FilterName="impress_pdf_Export"))
+        except Exception as e:
+            if timed_out.is_set():
+                raise TimeoutError(
+                    f"LibreOffice did not convert {pptx_path.name} within {self.CONVERT_TIMEOUT} seconds"
+                ) from e
+            raise
+        finally:
+            watchdog.cancel()
+            if document is not None and not timed_out.is_set():
+                document.close(True)
+
+    def stop(self) -> None:
+        """Terminate the LibreOffice process and remove its profile."""
+        if self.is_running():
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self._profile_dir.cleanup()
+
+
+_soffice_server: Optional[_SofficeServer] = None
+
+
+def get_soffice_server(libreoffice_path: Path) -> Optional[_SofficeServer]:
+    """
+    Return the shared LibreOffice listener, starting it on first use.
 
+    Args:
+        libreoffice_path: Path to the LibreOffice executable.
 
-def extract_speaker_notes(pptx_path: Path) -> list[str]:
+    Returns:
+        The running server, or None if the UNO bindings are not available
+        or the listener could not be started.
+    """
+    global _soffice_server
+    if _soffice_server is None or not _soffice_server.is_running():
+        try:
+            _soffice_server = _SofficeServer(libreoffice_path)
+        except ImportError:
+            return None
+        except RuntimeError as e:
+            print(f"Warning: {e}, falling back to soffice CLI")
+            _soffice_server = None
+            return None
+    return _soffice_server
+
+
+def extract_notes_and_count(pptx_path: Path) -> tuple[list[str], int]:
     """
-    Extract speaker notes from all slides in a PowerPoint presentation.
+    Extract speaker notes and the slide count from a PowerPoint presentation.
+
+    The presentation is parsed once; results are cached per file path and
+    modification time.
 
     Args:
         pptx_path: Path to the PPTX file.
 
     Returns:
-        List of speaker notes, one per slide.
+        Tuple of (speaker notes, one per slide, number of slides).
     """
-    prs = Presentation(str(pptx_path))
+    notes = _extract_speaker_notes(str(pptx_path), pptx_path.stat().st_mtime_ns)
+    return list(notes), len(notes)
+
+
+@functools.lru_cache(maxsize=16)
+def _extract_speaker_notes(pptx_path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Parse the presentation and collect the notes of every slide."""
+    prs = Presentation(pptx_path)
     notes = []
 
     for slide in prs.slides:
@@ -146,21 +378,34 @@ def extract_speaker_notes(pptx_path: Path) -> list[str]:
         else:
             notes.append("")
 
-    return notes
+    return tuple(notes)
 
 
-def get_slide_count(pptx_path: Path) -> int:
+class SlideImage(Flowable):
     """
-    Get the number of slides in a PowerPoint presentation.
-
-    Args:
-        pptx_path: Path to the PPTX file.
+    Slide image flowable that decodes its image only while being drawn.
 
-    Returns:
-        Number of slides.
+    reportlab's Image flowable keeps the decoded pixels of every slide alive
+    until the whole document is built. This flowable only holds the encoded
+    image data and releases the decoded image after drawing, so at most one
+    slide is decoded at a time.
     """
-    prs = Presentation(str(pptx_path))
-    return len(prs.slides)
+
+    def __init__(self, image_data: BinaryIO, width: float, height: float):
+        super().__init__()
+        self.image_data = image_data
+        self.drawWidth = width
+        self.drawHeight = height
+
+    def wrap(self, availWidth: float, availHeight: float) -> tuple[float, float]:
+        return self.drawWidth, self.drawHeight
+
+    def draw(self) -> None:
+        self.image_data.seek(0)
+        self.canv.drawImage(ImageReader(self.image_data), 0, 0, self.drawWidth, self.drawHeight)
+
+
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
 
 
 def escape_xml(text: str) -> str:
@@ -173,45 +418,20 @@ def escape_xml(text: str) -> str:
     Returns:
         Escaped text safe for XML/HTML.
     """
-    return (
-        text
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-    )
+    return text.translate(_XML_ESCAPE)
 
 
-def create_pdf_with_notes(
-        slide_images: list[Path],
-        notes: list[str],
-        output_path: Path,
-) -> None:
+@functools.cache
+def get_paragraph_styles() -> dict[str, ParagraphStyle]:
     """
-    Create a PDF with slide images and speaker notes.
+    Build the paragraph styles of the reportlab layout.
 
-    Each page contains:
-    1. Slide image (visual representation)
-    2. Speaker notes below the image
+    getSampleStyleSheet loads font metrics, so the styles are created once
+    and shared by all conversions.
 
-    Args:
-        slide_images: List of paths to slide images (PNG files).
-        notes: List of speaker notes corresponding to each slide.
-        output_path: Path where the output PDF will be saved.
+    Returns:
+        Dictionary mapping style names to paragraph styles.
     """
-    # Create the PDF document
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=A4,
-        rightMargin=1 * cm,
-        leftMargin=1 * cm,
-        topMargin=1 * cm,
-        bottomMargin=1 * cm,
-    )
-
-    # Calculate available dimensions
-    page_width = A4[0] - 2 * cm
-
-    # Define styles
     styles = getSampleStyleSheet()
 
     slide_header_style = ParagraphStyle(
@@ -253,84 +473,371 @@ def create_pdf_with_notes(
         leftIndent=10,
     )
 
-    # Build the document content
-    story = []
+    return {
+        style.name: style
+        for style in (slide_header_style, notes_header_style, notes_style, no_content_style)
+    }
 
-    for idx, (image_path, note) in enumerate(
-            zip(slide_images, notes), start=1
-    ):
-        # Add slide header
-        story.append(Paragraph(f"Folie {idx}", slide_header_style))
 
-        # Add slide image
-        if image_path.exists():
-            with Image.open(image_path) as img:
-                img_width, img_height = img.size
+def create_slide_pages(
+        slide_image: tuple[BinaryIO, int, int],
+        note: str,
+        slide_number: int,
+) -> bytes:
+    """
+    Lay out a single slide image and its speaker notes with reportlab.
 
-            scale = page_width / img_width
-            display_width = page_width
-            display_height = img_height * scale
+    Used for slides whose notes do not fit on one page: the notes continue
+    on as many following pages as needed.
 
-            slide_img = RLImage(
-                str(image_path),
-                width=display_width,
-                height=display_height,
-            )
-            story.append(slide_img)
-        else:
-            story.append(Paragraph(
-                f"<i>Folienbild nicht verfuegbar: {image_path.name}</i>",
-                no_content_style
-            ))
+    Args:
+        slide_image: Tuple of (PPM/JPEG data, width, height), with the pixel
+                     size as rendered by PyMuPDF.
+        note: Speaker notes of the slide.
+        slide_number: One-based slide number shown in the header.
+
+    Returns:
+        The pages of the slide as PDF data.
+    """
+    buffer = io.BytesIO()
 
-        story.append(Spacer(1, 0.3 * cm))
+    # Create the PDF document
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        rightMargin=1 * cm,
+        leftMargin=1 * cm,
+        topMargin=1 * cm,
+        bottomMargin=1 * cm,
+    )
 
-        # Add speaker notes
-        story.append(Paragraph("Sprechernotizen:", notes_header_style))
+    # Calculate available dimensions
+    page_width = A4[0] - 2 * cm
 
-        if note:
-            formatted_note = escape_xml(note).replace("\n", "<br/>")
-            story.append(Paragraph(formatted_note, notes_style))
-        else:
-            story.append(Paragraph(
-                "Keine Sprechernotizen vorhanden.",
-                no_content_style
-            ))
+    styles = get_paragraph_styles()
+    image_data, img_width, img_height = slide_image
+
+    # Slide image scaled to the page width
+    scale = page_width / img_width
+    display_width = page_width
+    display_height = img_height * scale
 
-        # Add page break after each slide (except the last one)
-        if idx < len(slide_images):
-            story.append(PageBreak())
+    story = [
+        Paragraph(f"Folie {slide_number}", styles["SlideHeader"]),
+        SlideImage(image_data, display_width, display_height),
+        Spacer(1, 0.3 * cm),
+        Paragraph("Sprechernotizen:", styles["NotesHeader"]),
+    ]
+
+    # Add speaker notes
+    if note:
+        formatted_note = escape_xml(note).replace("\n", "<br/>")
+        story.append(Paragraph(formatted_note, styles["Notes"]))
+    else:
+        story.append(Paragraph(
+            "Keine Sprechernotizen vorhanden.",
+            styles["NoContent"]
+        ))
 
     # Build the PDF
     doc.build(story)
+    return buffer.getvalue()
 
 
-def convert_pptx_to_pdf_with_notes(
-        pptx_path: Path,
-        output_path: Optional[Path] = None,
-) -> Path:
+def build_slide_pages(pdf_path: str, page_num: int, zoom: float, note: str) -> bytes:
     """
-    Convert a PowerPoint presentation to PDF including speaker notes.
+    Render a slide to an image and lay it out with its speaker notes.
 
-    Uses LibreOffice to render slides as images, then combines them
-    with speaker notes extracted via python-pptx.
+    Runs in a worker process, see render_page and create_slide_pages.
 
     Args:
-        pptx_path: Path to the input PPTX file.
-        output_path: Optional path for the output PDF.
-                     If not provided, uses the same name as input with '.pdf' suffix.
+        pdf_path: Path to the PDF file.
+        page_num: Zero-based page number.
+        zoom: Render zoom factor.
+        note: Speaker notes of the slide.
 
     Returns:
-        Path to the generated PDF file.
+        The pages of the slide as PDF data.
+    """
+    _, image_bytes, width, height = render_page(pdf_path, page_num, zoom)
+    return create_slide_pages((io.BytesIO(image_bytes), width, height), note, page_num + 1)
+
+
+def create_pdf_vector(
+        slides_pdf: Path,
+        notes: list[str],
+        output_path: Path,
+) -> None:
+    """
+    Create a PDF with vector slides and speaker notes.
+
+    Each page of the LibreOffice PDF is placed on an A4 page as a vector
+    object, so slides are not rasterized and their text stays selectable.
+    Slides whose notes do not fit on the page are rendered to an image and
+    laid out with reportlab instead (see create_slide_pages); their pages
+    are spliced into the document at the slide's position.
+
+    Args:
+        slides_pdf: PDF with one page per slide as produced by LibreOffice.
+        notes: List of speaker notes, one per page of slides_pdf.
+        output_path: Path where the output PDF will be saved.
+    """
+    page_width, page_height = A4
+    margin = 1 * cm
+    content_width = page_width - 2 * margin
+    header_color = HexColor("#2E4057").rgb()
+    notes_color = HexColor("#333333").rgb()
+    no_content_color = HexColor("#999999").rgb()
+
+    # Slide area, notes header position and notes area per slide size. Decks
+    # normally use one slide size, so the layout is computed only once.
+    layouts: dict[tuple[float, float], tuple[fitz.Rect, float, fitz.Rect]] = {}
+
+    with fitz.open(str(slides_pdf)) as src, fitz.open() as out:
+        overflowing = []
+        for page_num, note in enumerate(notes):
+            page = out.new_page(width=page_width, height=page_height)
+
+            slide_rect = src[page_num].rect
+            layout = layouts.get((slide_rect.width, slide_rect.height))
+            if layout is None:
+                # Slide area below the header, scaled to the content width
+                y = margin + 14 + 8
+                display_height = slide_rect.height * content_width / slide_rect.width
+                slide_target = fitz.Rect(margin, y, margin + content_width, y + display_height)
+                y += display_height + 0.3 * cm + 10 + 10
+                notes_rect = fitz.Rect(margin + 10, y + 4, page_width - margin, page_height - margin)
+                layout = layouts[slide_rect.width, slide_rect.height] = (slide_target, y, notes_rect)
+            slide_target, notes_header_y, notes_rect = layout
+
+            # Embedded once per document, later pages reference the same font
+            for fontname, fontfile in VECTOR_FONTS.items():
+                page.insert_font(fontname=fontname, fontfile=str(fontfile))
+
+            # Slide header. The slide itself is placed last: text inserted after
+            # show_pdf_page can pick up the embedded page's font resources and
+            # render with the wrong glyphs.
+            page.insert_text(
+                (margin, margin + 14), f"Folie {page_num + 1}", fontname="verabd", fontsize=14, color=header_color
+            )
+
+            # Speaker notes
+            page.insert_text(
+                (margin, notes_header_y), "Sprechernotizen:", fontname="verabd", fontsize=10, color=header_color
+            )
+
+            if note:
+                remaining = page.insert_textbox(
+                    notes_rect, note, fontname="vera", fontsize=9, lineheight=12 / 9, color=notes_color,
+                )
+            else:
+                remaining = page.insert_textbox(
+                    notes_rect, "Keine Sprechernotizen vorhanden.", fontname="verait", fontsize=9,
+                    color=no_content_color,
+                )
+            if remaining < 0:
+                # The page is replaced by the reportlab layout below
+                overflowing.append(page_num)
+                continue
+
+            # Slide as vector graphics
+            page.show_pdf_page(slide_target, src, page_num)
+
+        if overflowing:
+            print(f"Notes of {len(overflowing)} slides do not fit on one page, rendering slide images...")
+            zoom = slide_zoom(src[overflowing[0]].rect.width)
+
+            # Each worker process renders one slide and lays out its pages,
+            # the resulting PDFs are spliced in here in slide order
+            max_workers = min(len(overflowing), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                sections = executor.map(
+                    build_slide_pages,
+                    repeat(str(slides_pdf)),
+                    overflowing,
+                    repeat(zoom),
+                    [notes[page_num] for page_num in overflowing],
+                )
+                # Extra pages of earlier slides shift the position of later ones
+                offset = 0
+                for page_num, slide_pages in zip(overflowing, sections, strict=True):
+                    with fitz.open("pdf", slide_pages) as section:
+                        out.delete_page(page_num + offset)
+                        out.insert_pdf(section, start_at=page_num + offset)
+                        offset += len(section) - 1
+
+        out.save(str(output_path), garbage=3, deflate=True)
+
+
+def _run_soffice(
+        pptx_paths: Sequence[Path],
+        output_dir: Path,
+        libreoffice_path: Path,
+) -> str:
+    """
+    Convert presentations to PDF in one soffice process.
+
+    Args:
+        pptx_paths: Paths to the PPTX files.
+        output_dir: Directory where the PDFs will be written.
+        libreoffice_path: Path to the LibreOffice executable.
+
+    Returns:
+        The last lines of the soffice output.
+
+    Raises:
+        RuntimeError: If soffice exits with an error.
+    """
+    # A separate user profile keeps soffice from handing the job over to an
+    # already running LibreOffice and exiting before the PDFs exist. It also
+    # lets several soffice processes run side by side.
+    with tempfile.TemporaryDirectory(prefix="lo_profile_") as profile_dir:
+        cmd = [
+            str(libreoffice_path),
+            *SOFFICE_FLAGS,
+            f"-env:UserInstallation={Path(profile_dir).as_uri()}",
+            "--convert-to", "pdf",
+            "--outdir", str(output_dir),
+            *map(str, pptx_paths),
+        ]
+
+        # soffice can print megabytes of font warnings for large decks, so
+        # the output is streamed and only its last lines are kept
+        output_tail: deque[str] = deque(maxlen=SOFFICE_OUTPUT_LINES)
+        with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+        ) as process:
+            reader = threading.Thread(target=output_tail.extend, args=(process.stdout,), daemon=True)
+            reader.start()
+            try:
+                returncode = process.wait(timeout=600 * len(pptx_paths))  # 10 minutes timeout per file
+            except subprocess.TimeoutExpired:
+                process.kill()
+                raise
+            finally:
+                # A helper process of soffice may keep the pipe open after a kill
+                reader.join(timeout=10)
+
+    soffice_output = "".join(output_tail)
+    if returncode != 0:
+        raise RuntimeError(
+            f"LibreOffice conversion failed: {soffice_output}"
+        )
+    return soffice_output
+
+
+def _run_soffice_conversion(
+        pptx_paths: Sequence[Path],
+        output_dir: Path,
+        libreoffice_path: Path,
+) -> list[Path]:
+    """
+    Convert presentations to PDF with LibreOffice.
+
+    Uses the shared LibreOffice listener if available. Otherwise the files
+    are split across up to one soffice process per CPU, each converting
+    its share in a single call with its own user profile.
+
+    Args:
+        pptx_paths: Paths to the PPTX files. Their names must be unique.
+        output_dir: Directory where the PDFs will be written.
+        libreoffice_path: Path to the LibreOffice executable.
+
+    Returns:
+        Paths to the generated PDFs, in the order of pptx_paths.
 
     Raises:
-        FileNotFoundError: If input file or LibreOffice not found.
         RuntimeError: If conversion fails.
     """
-    pptx_path = Path(pptx_path).resolve()
+    pdf_files = [output_dir / f"{pptx_path.stem}.pdf" for pptx_path in pptx_paths]
+    soffice_server = get_soffice_server(libreoffice_path)
+
+    if soffice_server:
+        for pptx_path, pdf_file in zip(pptx_paths, pdf_files, strict=True):
+            soffice_server.convert_to_pdf(pptx_path, pdf_file)
+        soffice_output = ""
+    else:
+        # Each soffice process renders single-threaded, so the files are
+        # spread across several processes that run side by side
+        process_count = min(len(pptx_paths), os.cpu_count() or 1)
+        batches = [pptx_paths[i::process_count] for i in range(process_count)]
+        with ThreadPoolExecutor(max_workers=process_count) as executor:
+            outputs = executor.map(_run_soffice, batches, repeat(output_dir), repeat(libreoffice_path))
+            soffice_output = "".join(outputs)
+
+    # Find the generated PDFs
+    for pdf_file in pdf_files:
+        if not pdf_file.exists():
+            raise RuntimeError(
+                f"PDF not generated: {pdf_file.name}. LibreOffice output: {soffice_output}"
+            )
+        print(f"PDF created: {pdf_file.name}")
+
+    return pdf_files
+
+
+def _add_notes_to_pdf(pptx_path: Path, pdf_file: Path, output_path: Path) -> None:
+    """
+    Combine the LibreOffice PDF of a presentation with its speaker notes.
+
+    Args:
+        pptx_path: Path to the PPTX file.
+        pdf_file: PDF of the slides as produced by LibreOffice.
+        output_path: Path where the output PDF will be saved.
+    """
+    # Step 2: Extract speaker notes
+    print(f"Extracting speaker notes from {pptx_path.name}...")
+    notes, slide_count = extract_notes_and_count(pptx_path)
+    print(f"Found {slide_count} slides with {sum(1 for n in notes if n)} notes")
+
+    with fitz.open(str(pdf_file)) as pdf_doc:
+        page_count = len(pdf_doc)
+
+    # Verify we have the right number of pages
+    if page_count != slide_count:
+        print(
+            f"Warning: Number of PDF pages ({page_count}) "
+            f"doesn't match slide count ({slide_count})"
+        )
+        # Pad notes if we have more pages
+        while len(notes) < page_count:
+            notes.append("")
+        # Truncate if we have fewer pages
+        notes = notes[:page_count]
+
+    # Step 3: Create final PDF with slides and notes
+    print("Creating PDF with slides and notes...")
+    create_pdf_vector(pdf_file, notes, output_path)
+
+    print(f"Successfully created: {output_path}")
+
+
+def _convert(jobs: list[tuple[Path, Path]]) -> list[Path]:
+    """
+    Convert presentations to PDFs including speaker notes.
 
-    if not pptx_path.exists():
-        raise FileNotFoundError(f"Input file not found: {pptx_path}")
+    Args:
+        jobs: List of (input PPTX path, output PDF path) tuples.
+
+    Returns:
+        Paths to the generated PDF files.
+
+    Raises:
+        FileNotFoundError: If an input file or LibreOffice not found.
+        ValueError: If two input files have the same name.
+        RuntimeError: If conversion fails.
+    """
+    for pptx_path, _ in jobs:
+        if not pptx_path.exists():
+            raise FileNotFoundError(f"Input file not found: {pptx_path}")
+
+    # LibreOffice writes all PDFs into one directory, named after the input file
+    stems = [pptx_path.stem for pptx_path, _ in jobs]
+    if len(set(stems)) != len(stems):
+        raise ValueError("Input files must have unique names")
 
     # Find LibreOffice
     libreoffice_path = find_libreoffice()
@@ -342,94 +849,96 @@ def convert_pptx_to_pdf_with_notes(
             "  Windows: Download from https://www.libreoffice.org/"
         )
 
-    if output_path is None:
-        output_path = pptx_path.parent / f"{pptx_path.stem}.pdf"
-    else:
-        output_path = Path(output_path).resolve()
-
-    print(f"Converting: {pptx_path.name}")
-    print(f"Output: {output_path}")
+    for pptx_path, output_path in jobs:
+        print(f"Converting: {pptx_path.name}")
+        print(f"Output: {output_path}")
     print(f"Using LibreOffice: {libreoffice_path}")
 
     # Create temporary directory for intermediate files
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
 
-        # Step 1: Convert PPTX to PDF using LibreOffice
+        # Step 1: Convert all PPTX files to PDF using LibreOffice
         print("Converting PPTX to PDF with LibreOffice...")
-        cmd = [
-            str(libreoffice_path),
-            "--headless",
-            "--convert-to", "pdf",
-            "--outdir", str(temp_path),
-            str(pptx_path),
-        ]
+        pptx_paths = [pptx_path for pptx_path, _ in jobs]
+        pdf_files = _run_soffice_conversion(pptx_paths, temp_path, libreoffice_path)
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minutes timeout
-        )
+        # PyMuPDF is not thread-safe, so the files are finished one after another.
+        # Rendering the slide images for the fallback layout runs in worker processes.
+        for (pptx_path, output_path), pdf_file in zip(jobs, pdf_files, strict=True):
+            _add_notes_to_pdf(pptx_path, pdf_file, output_path)
 
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"LibreOffice conversion failed: {result.stderr}"
-            )
+    return [output_path for _, output_path in jobs]
 
-        # Find the generated PDF
-        pdf_file = temp_path / f"{pptx_path.stem}.pdf"
-        if not pdf_file.exists():
-            raise RuntimeError(
-                f"PDF not generated. LibreOffice output: {result.stdout}"
-            )
 
-        print(f"PDF created: {pdf_file.name}")
+def convert_pptx_to_pdf_with_notes(
+        pptx_path: Path,
+        output_path: Optional[Path] = None,
+) -> Path:
+    """
+    Convert a PowerPoint presentation to PDF including speaker notes.
 
-        # Step 2: Extract PDF pages as images using PyMuPDF
-        print("Extracting slide images from PDF...")
-        pdf_doc = fitz.open(str(pdf_file))
-        png_files = []
-
-        # Use higher resolution for better quality (2x scale)
-        zoom_matrix = fitz.Matrix(2.0, 2.0)
-
-        for page_num in range(len(pdf_doc)):
-            page = pdf_doc[page_num]
-            pix = page.get_pixmap(matrix=zoom_matrix)
-
-            # Save as PNG
-            png_path = temp_path / f"slide_{page_num + 1:03d}.png"
-            pix.save(str(png_path))
-            png_files.append(png_path)
-
-        pdf_doc.close()
-        print(f"Extracted {len(png_files)} slide images")
-
-        # Step 3: Extract speaker notes
-        print("Extracting speaker notes...")
-        notes = extract_speaker_notes(pptx_path)
-        slide_count = get_slide_count(pptx_path)
-        print(f"Found {slide_count} slides with {sum(1 for n in notes if n)} notes")
-
-        # Verify we have the right number of images
-        if len(png_files) != slide_count:
-            print(
-                f"Warning: Number of images ({len(png_files)}) "
-                f"doesn't match slide count ({slide_count})"
-            )
-            # Pad notes if we have more images
-            while len(notes) < len(png_files):
-                notes.append("")
-            # Truncate if we have fewer images
-            notes = notes[:len(png_files)]
+    Uses LibreOffice to render the slides to PDF, then combines them
+    with speaker notes extracted via python-pptx.
 
-        # Step 4: Create final PDF with images and notes
-        print("Creating PDF with slides and notes...")
-        create_pdf_with_notes(png_files, notes, output_path)
+    Args:
+        pptx_path: Path to the input PPTX file.
+        output_path: Optional path for the output PDF.
+                     If not provided, uses the same name as input with '.pdf' suffix.
 
-    print(f"Successfully created: {output_path}")
-    return output_path
+    Returns:
+        Path to the generated PDF file.
+
+    Raises:
+        FileNotFoundError: If input file or LibreOffice not found.
+        RuntimeError: If conversion fails.
+    """
+    # absolute() only prefixes the working directory, unlike resolve() it does
+    # not walk the path with a system call per component
+    pptx_path = Path(pptx_path).expanduser().absolute()
+
+    if output_path is None:
+        output_path = pptx_path.parent / f"{pptx_path.stem}.pdf"
+    else:
+        output_path = Path(output_path).expanduser().absolute()
+
+    return _convert([(pptx_path, output_path)])[0]
+
+
+def convert_many(
+        pptx_paths: Sequence[Path],
+        output_dir: Optional[Path] = None,
+) -> list[Path]:
+    """
+    Convert several PowerPoint presentations to PDFs including speaker notes.
+
+    The presentations are rendered by the shared LibreOffice listener, or
+    split across a few soffice processes that each convert their share in
+    one run, so the LibreOffice startup cost is not paid per file.
+
+    Args:
+        pptx_paths: Paths to the input PPTX files.
+        output_dir: Optional directory for the output PDFs.
+                    If not provided, each PDF is written next to its input file.
+
+    Returns:
+        Paths to the generated PDF files, in the order of pptx_paths.
+
+    Raises:
+        FileNotFoundError: If an input file or LibreOffice not found.
+        ValueError: If two input files have the same name.
+        RuntimeError: If conversion fails.
+    """
+    if output_dir is not None:
+        output_dir = Path(output_dir).expanduser().absolute()
+
+    jobs = []
+    for pptx_path in pptx_paths:
+        pptx_path = Path(pptx_path).expanduser().absolute()
+        target_dir = pptx_path.parent if output_dir is None else output_dir
+        jobs.append((pptx_path, target_dir / f"{pptx_path.stem}.pdf"))
+
+    return _convert(jobs) if jobs else []
 
 
 def main() -> None:
@@ -446,7 +955,11 @@ def main() -> None:
     output_file = data_dir / "Inside Agentic AI.pdf"
 
     try:
-        convert_pptx_to_pdf_with_notes(pptx_file, output_file)
+        if len(sys.argv) > 1:
+            # Convert all files given on the command line in one batch
+            convert_many([Path(arg) for arg in sys.argv[1:]])
+        else:
+            convert_pptx_to_pdf_with_notes(pptx_file, output_file)
     except FileNotFoundError as e:
         print(f"Error: {e}")
         sys.exit(1)
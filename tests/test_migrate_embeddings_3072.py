@@ -0,0 +1,62 @@
+"""Tests for the adaptive admission limit in scripts/migrate_embeddings_3072.py."""
+
+import asyncio
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+from migrate_embeddings_3072 import Admission
+
+
+def make_rate_limit_error() -> RateLimitError:
+    request = httpx.Request("POST", "https://example.openai.azure.com/openai/deployments/emb/embeddings")
+    return RateLimitError("Too Many Requests", response=httpx.Response(429, request=request), body=None)
+
+
+async def run_request(admission: Admission, exc: Exception | None = None) -> None:
+    if exc is None:
+        async with admission:
+            pass
+        return
+    with pytest.raises(type(exc)):
+        async with admission:
+            raise exc
+
+
+def test_admission_adapts_only_to_rate_limits():
+    async def scenario() -> None:
+        admission = Admission(limit=8, increase_after=2)
+
+        # 429 halves the limit
+        await run_request(admission, make_rate_limit_error())
+        assert admission.max_in_flight == 4
+
+        # Other errors neither lower the limit nor reset the success streak
+        await run_request(admission)
+        await run_request(admission, TimeoutError("read timed out"))
+        await run_request(admission, ValueError("input too long"))
+        assert admission.max_in_flight == 4
+        await run_request(admission)
+        assert admission.max_in_flight == 5
+
+        # A run of non-429 errors during an outage does not raise the limit either
+        for _ in range(10):
+            await run_request(admission, RuntimeError("503 Service Unavailable"))
+        assert admission.max_in_flight == 5
+
+        await run_request(admission, make_rate_limit_error())
+        assert admission.max_in_flight == 2
+        assert admission.in_flight == 0
+
+    asyncio.run(scenario())
+
+
+def test_admission_never_exceeds_configured_limit():
+    async def scenario() -> None:
+        admission = Admission(limit=2, increase_after=1)
+        for _ in range(5):
+            await run_request(admission)
+        assert admission.max_in_flight == 2
+
+    asyncio.run(scenario())